@@ -14,6 +14,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
 import importlib
 import json
 import os
@@ -25,6 +26,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable, Generator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Type, TypeAlias, TypedDict, Union
@@ -97,8 +99,14 @@ from .utils import (
 logger = getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _compile_template(template: str) -> Template:
+    # Prompt templates are static strings rendered at every step: compile each of them only once
+    return Template(template, undefined=StrictUndefined)
+
+
 def populate_template(template: str, variables: dict[str, Any]) -> str:
-    compiled_template = Template(template, undefined=StrictUndefined)
+    compiled_template = _compile_template(template)
     try:
         return compiled_template.render(**variables)
     except Exception as e:
@@ -190,6 +198,29 @@ EMPTY_PROMPT_TEMPLATES = PromptTemplates(
 )
 
 
+@lru_cache(maxsize=None)
+def _parse_default_prompt_templates(filename: str) -> PromptTemplates:
+    text = importlib.resources.files("smolagents.prompts").joinpath(filename).read_text()
+    # Use the libyaml C parser when PyYAML was built with it
+    return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def load_default_prompt_templates(filename: str) -> PromptTemplates:
+    """
+    Load one of the default prompt templates files shipped in `smolagents.prompts`.
+
+    The file is read and parsed only once per process: subsequent calls return a deep copy of the cached result,
+    so that agents can freely customize their own prompt templates.
+
+    Args:
+        filename (`str`): Name of the YAML file in `smolagents.prompts`, e.g. `"code_agent.yaml"`.
+
+    Returns:
+        [`~agents.PromptTemplates`]: The prompt templates.
+    """
+    return copy.deepcopy(_parse_default_prompt_templates(filename))
+
+
 @dataclass
 class RunResult:
     """Holds extended information about an agent run.
@@ -1213,9 +1244,7 @@ class ToolCallingAgent(MultiStepAgent):
         max_tool_threads: int | None = None,
         **kwargs,
     ):
-        prompt_templates = prompt_templates or yaml.safe_load(
-            importlib.resources.files("smolagents.prompts").joinpath("toolcalling_agent.yaml").read_text()
-        )
+        prompt_templates = prompt_templates or load_default_prompt_templates("toolcalling_agent.yaml")
         super().__init__(
             tools=tools,
             model=model,
@@ -1519,13 +1548,9 @@ class CodeAgent(MultiStepAgent):
         self.max_print_outputs_length = max_print_outputs_length
         self._use_structured_outputs_internally = use_structured_outputs_internally
         if self._use_structured_outputs_internally:
-            prompt_templates = prompt_templates or yaml.safe_load(
-                importlib.resources.files("smolagents.prompts").joinpath("structured_code_agent.yaml").read_text()
-            )
+            prompt_templates = prompt_templates or load_default_prompt_templates("structured_code_agent.yaml")
         else:
-            prompt_templates = prompt_templates or yaml.safe_load(
-                importlib.resources.files("smolagents.prompts").joinpath("code_agent.yaml").read_text()
-            )
+            prompt_templates = prompt_templates or load_default_prompt_templates("code_agent.yaml")
 
         if isinstance(code_block_tags, str) and not code_block_tags == "markdown":
             raise ValueError("Only 'markdown' is supported for a string argument to `code_block_tags`.")
@@ -24,10 +24,10 @@ import re
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Generator, Mapping
 from dataclasses import dataclass
-from functools import wraps
+from functools import lru_cache, wraps
 from importlib import import_module
 from importlib.util import find_spec
-from types import BuiltinFunctionType, FunctionType, ModuleType
+from types import BuiltinFunctionType, FunctionType, MappingProxyType, ModuleType
 from typing import Any
 
 from .tools import Tool
@@ -322,8 +322,19 @@ def build_import_tree(authorized_imports: list[str]) -> dict[str, Any]:
     return tree
 
 
+def _freeze_import_tree(tree: dict[str, Any]) -> Mapping[str, Any]:
+    return MappingProxyType({part: _freeze_import_tree(subtree) for part, subtree in tree.items()})
+
+
+@lru_cache(maxsize=32)
+def _get_import_tree(authorized_imports: tuple[str, ...]) -> Mapping[str, Any]:
+    # Cached: the same authorized imports are checked on every import, module access and submodule of a safe module.
+    # The tree is shared between calls, so it is returned as a read-only view.
+    return _freeze_import_tree(build_import_tree(authorized_imports))
+
+
 def check_import_authorized(import_to_check: str, authorized_imports: list[str]) -> bool:
-    current_node = build_import_tree(authorized_imports)
+    current_node = _get_import_tree(tuple(authorized_imports))
     for part in import_to_check.split("."):
         if "*" in current_node:
             return True
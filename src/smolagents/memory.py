@@ -284,7 +284,8 @@ class CallbackRegistry:
     """
 
     def __init__(self):
-        self._callbacks: dict[Type[MemoryStep], list[Callable]] = {}
+        # Each callback is stored with whether it takes only the step, inspected once at registration
+        self._callbacks: dict[Type[MemoryStep], list[tuple[Callable, bool]]] = {}
 
     def register(self, step_cls: Type[MemoryStep], callback: Callable):
         """Register a callback for a step class.
@@ -295,7 +296,7 @@ class CallbackRegistry:
         """
         if step_cls not in self._callbacks:
             self._callbacks[step_cls] = []
-        self._callbacks[step_cls].append(callback)
+        self._callbacks[step_cls].append((callback, len(inspect.signature(callback).parameters) == 1))
 
     def callback(self, memory_step, **kwargs):
         """Call callbacks registered for a step type.
@@ -312,5 +313,5 @@ class CallbackRegistry:
         """
         # For compatibility with old callbacks that only take the step as an argument
         for cls in memory_step.__class__.__mro__:
-            for cb in self._callbacks.get(cls, []):
-                cb(memory_step) if len(inspect.signature(cb).parameters) == 1 else cb(memory_step, **kwargs)
+            for cb, takes_only_step in self._callbacks.get(cls, []):
+                cb(memory_step) if takes_only_step else cb(memory_step, **kwargs)
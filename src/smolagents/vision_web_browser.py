@@ -23,6 +23,13 @@ search_request = """
 Please navigate to https://en.wikipedia.org/wiki/Chicago and give me a sentence containing the word "1992" that mentions a construction accident.
 """
 
+CHROME_ARGUMENTS = (
+    "--force-device-scale-factor=1",
+    "--window-size=1000,1350",
+    "--disable-pdf-viewer",
+    "--window-position=0,0",
+)
+
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description="Run a web browser automation script with a specified model.")
@@ -71,16 +78,17 @@ def save_screenshot(memory_step: ActionStep, agent: CodeAgent) -> None:
         for previous_memory_step in agent.memory.steps:  # Remove previous screenshots from logs for lean processing
             if isinstance(previous_memory_step, ActionStep) and previous_memory_step.step_number <= current_step - 2:
                 previous_memory_step.observations_images = None
+        current_url = driver.current_url  # Read right before the capture, so that the URL matches the screenshot
         png_bytes = driver.get_screenshot_as_png()
         image = PIL.Image.open(BytesIO(png_bytes))
         print(f"Captured a browser screenshot: {image.size} pixels")
         memory_step.observations_images = [image.copy()]  # Create a copy to ensure it persists, important!
 
-    # Update observations with current URL
-    url_info = f"Current url: {driver.current_url}"
-    memory_step.observations = (
-        url_info if memory_step.observations is None else memory_step.observations + "\n" + url_info
-    )
+        # Update observations with current URL
+        url_info = f"Current url: {current_url}"
+        memory_step.observations = (
+            url_info if memory_step.observations is None else memory_step.observations + "\n" + url_info
+        )
     return
 
 
@@ -138,10 +146,8 @@ def close_popups() -> str:
 def initialize_driver():
     """Initialize the Selenium WebDriver."""
     chrome_options = webdriver.ChromeOptions()
-    chrome_options.add_argument("--force-device-scale-factor=1")
-    chrome_options.add_argument("--window-size=1000,1350")
-    chrome_options.add_argument("--disable-pdf-viewer")
-    chrome_options.add_argument("--window-position=0,0")
+    for argument in CHROME_ARGUMENTS:
+        chrome_options.add_argument(argument)
     return helium.start_chrome(headless=False, options=chrome_options)
 
 
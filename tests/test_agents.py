@@ -46,6 +46,8 @@ from smolagents.agents import (
     ToolCall,
     ToolCallingAgent,
     ToolOutput,
+    _compile_template,
+    load_default_prompt_templates,
     populate_template,
 )
 from smolagents.default_tools import DuckDuckGoSearchTool, FinalAnswerTool, PythonInterpreterTool, VisitWebpageTool
@@ -2505,6 +2507,39 @@ final_answer("Final report.")
         assert "├──" in capture.get()
 
 
+def test_populate_template_reuses_compiled_template():
+    template = "Hello {{name}}!"
+    _compile_template.cache_clear()
+    assert populate_template(template, {"name": "Alice"}) == "Hello Alice!"
+    assert populate_template(template, {"name": "Bob"}) == "Hello Bob!"
+    cache_info = _compile_template.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 1)
+
+
+def test_populate_template_raises_on_missing_variable():
+    template = "Hello {{name}}!"
+    with pytest.raises(Exception, match="Error during jinja template rendering"):
+        populate_template(template, {})
+
+
+@pytest.mark.parametrize("filename", ["code_agent.yaml", "structured_code_agent.yaml", "toolcalling_agent.yaml"])
+def test_load_default_prompt_templates_returns_independent_copies(filename):
+    first = load_default_prompt_templates(filename)
+    second = load_default_prompt_templates(filename)
+    assert first == second
+    assert first is not second
+    first["managed_agent"]["task"] += "Custom addition"
+    assert not second["managed_agent"]["task"].endswith("Custom addition")
+    assert load_default_prompt_templates(filename) == second
+
+
+def test_agents_do_not_share_default_prompt_templates():
+    agent = CodeAgent(tools=[], model=MagicMock())
+    agent.prompt_templates["system_prompt"] += "Custom addition"
+    other_agent = CodeAgent(tools=[], model=MagicMock())
+    assert not other_agent.prompt_templates["system_prompt"].endswith("Custom addition")
+
+
 @pytest.fixture
 def prompt_templates():
     return {
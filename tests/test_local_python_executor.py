@@ -2005,6 +2005,18 @@ def test_check_import_authorized(module: str, authorized_imports: list[str], exp
     assert check_import_authorized(module, authorized_imports) == expected
 
 
+def test_check_import_authorized_follows_changes_to_authorized_imports():
+    authorized_imports = ["os", "numpy"]
+    assert check_import_authorized("numpy", authorized_imports)
+    assert not check_import_authorized("pandas", authorized_imports)
+
+    authorized_imports.append("pandas")
+    assert check_import_authorized("pandas", authorized_imports)
+
+    authorized_imports.remove("numpy")
+    assert not check_import_authorized("numpy", authorized_imports)
+
+
 class TestLocalPythonExecutor:
     @pytest.mark.parametrize(
         "additional_authorized_imports, should_raise",
@@ -7,6 +7,7 @@ from smolagents.agents import ToolCall
 from smolagents.memory import (
     ActionStep,
     AgentMemory,
+    CallbackRegistry,
     ChatMessage,
     MemoryStep,
     MessageRole,
@@ -271,3 +272,30 @@ def test_memory_step_json_serialization():
     # Raw field should be present but serializable
     assert "raw" in json_str
     assert "MockChatCompletion" in json_str
+
+
+class TestCallbackRegistry:
+    def test_callback_dispatches_on_signature(self):
+        calls = []
+
+        def step_only_callback(memory_step):
+            calls.append(("step_only", memory_step))
+
+        def step_and_agent_callback(memory_step, agent=None):
+            calls.append(("step_and_agent", memory_step, agent))
+
+        registry = CallbackRegistry()
+        registry.register(ActionStep, step_only_callback)
+        registry.register(MemoryStep, step_and_agent_callback)
+        registry.register(PlanningStep, step_only_callback)
+
+        action_step = ActionStep(step_number=1, timing=Timing(start_time=0.0))
+        registry.callback(action_step, agent="agent")
+        assert calls == [("step_only", action_step), ("step_and_agent", action_step, "agent")]
+
+    def test_register_inspects_signature_at_registration(self):
+        registry = CallbackRegistry()
+        # Some builtins, like `max`, expose no signature to inspect
+        with pytest.raises(ValueError):
+            registry.register(ActionStep, max)
+        assert registry._callbacks.get(ActionStep, []) == []
@@ -1,10 +1,20 @@
-"""Test XPath injection vulnerability fix in vision_web_browser.py"""
+"""Test the vision_web_browser.py helpers: XPath escaping, screenshots and driver setup"""
 
+from io import BytesIO
 from unittest.mock import Mock, patch
 
+import PIL.Image
 import pytest
 
-from smolagents.vision_web_browser import _escape_xpath_string, search_item_ctrl_f
+from smolagents.memory import ActionStep
+from smolagents.monitoring import Timing
+from smolagents.vision_web_browser import (
+    CHROME_ARGUMENTS,
+    _escape_xpath_string,
+    initialize_driver,
+    save_screenshot,
+    search_item_ctrl_f,
+)
 
 
 @pytest.fixture
@@ -16,6 +26,17 @@ def mock_driver():
     return driver
 
 
+@pytest.fixture
+def mock_browser_driver():
+    """Mock Selenium WebDriver on a loaded page"""
+    driver = Mock()
+    driver.current_url = "https://example.com/"
+    buffer = BytesIO()
+    PIL.Image.new("RGB", (8, 6)).save(buffer, format="PNG")
+    driver.get_screenshot_as_png.return_value = buffer.getvalue()
+    return driver
+
+
 class TestXPathEscaping:
     """Test XPath string escaping functionality"""
 
@@ -130,3 +151,75 @@ class TestSearchItemCtrlF:
         with patch("smolagents.vision_web_browser.driver", mock_driver, create=True):
             with pytest.raises(Exception, match="Match n°3 not found"):
                 search_item_ctrl_f("test", nth_result=3)
+
+
+class TestSaveScreenshot:
+    """Test the save_screenshot step callback"""
+
+    def test_save_screenshot(self, mock_browser_driver):
+        memory_step = ActionStep(step_number=1, timing=Timing(start_time=0.0))
+        agent = Mock()
+        agent.memory.steps = [memory_step]
+        with (
+            patch("smolagents.vision_web_browser.helium.get_driver", return_value=mock_browser_driver),
+            patch("smolagents.vision_web_browser.sleep"),
+        ):
+            save_screenshot(memory_step, agent)
+        assert len(memory_step.observations_images) == 1
+        assert memory_step.observations_images[0].size == (8, 6)
+        assert memory_step.observations == "Current url: https://example.com/"
+
+    def test_save_screenshot_waits_for_animations(self, mock_browser_driver):
+        memory_step = ActionStep(step_number=1, timing=Timing(start_time=0.0))
+        agent = Mock()
+        agent.memory.steps = [memory_step]
+        with (
+            patch("smolagents.vision_web_browser.helium.get_driver", return_value=mock_browser_driver),
+            patch("smolagents.vision_web_browser.sleep") as mock_sleep,
+        ):
+            save_screenshot(memory_step, agent)
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_save_screenshot_reads_url_right_before_capture(self):
+        memory_step = ActionStep(step_number=1, timing=Timing(start_time=0.0))
+        agent = Mock()
+        agent.memory.steps = [memory_step]
+        calls = []
+        buffer = BytesIO()
+        PIL.Image.new("RGB", (8, 6)).save(buffer, format="PNG")
+
+        class RecordingDriver:
+            @property
+            def current_url(self):
+                calls.append("current_url")
+                return "https://example.com/"
+
+            def get_screenshot_as_png(self):
+                calls.append("get_screenshot_as_png")
+                return buffer.getvalue()
+
+        with (
+            patch("smolagents.vision_web_browser.helium.get_driver", return_value=RecordingDriver()),
+            patch("smolagents.vision_web_browser.sleep", side_effect=lambda _: calls.append("sleep")),
+        ):
+            save_screenshot(memory_step, agent)
+        assert calls == ["sleep", "current_url", "get_screenshot_as_png"]
+        assert memory_step.observations == "Current url: https://example.com/"
+
+    def test_save_screenshot_without_driver(self):
+        memory_step = ActionStep(step_number=1, timing=Timing(start_time=0.0))
+        with (
+            patch("smolagents.vision_web_browser.helium.get_driver", return_value=None),
+            patch("smolagents.vision_web_browser.sleep"),
+        ):
+            save_screenshot(memory_step, Mock())
+        assert memory_step.observations_images is None
+        assert memory_step.observations is None
+
+
+def test_initialize_driver():
+    with patch("smolagents.vision_web_browser.helium.start_chrome") as mock_start_chrome:
+        initialize_driver()
+    chrome_options = mock_start_chrome.call_args.kwargs["options"]
+    assert chrome_options.arguments == list(CHROME_ARGUMENTS)
+    assert mock_start_chrome.call_args.kwargs["headless"] is False